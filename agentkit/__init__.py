@@ -3,24 +3,35 @@ AgentKit
 A lightweight, flexible toolkit for extending AI agents and MCP servers with modular capabilities.
 """
 
-from .loader import Plugins, load_plugins
-from .env_utils import PluginEnvManager, create_env_manager
-from .depcheck import (
-    check_plugin_dependencies,
-    generate_plugin_requirements,
-    extract_dependencies_from_plugin
-)
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "BatteryShark"
 
-# Convenience exports
-__all__ = [
-    "Plugins",
-    "load_plugins", 
-    "PluginEnvManager",
-    "create_env_manager",
-    "check_plugin_dependencies",
-    "generate_plugin_requirements",
-    "extract_dependencies_from_plugin"
-] 
\ No newline at end of file
+# Convenience exports (name -> module, attribute), imported on first access
+_LAZY = {
+    "Plugins": (".loader", "Plugins"),
+    "load_plugins": (".loader", "load_plugins"),
+    "PluginEnvManager": (".env_utils", "PluginEnvManager"),
+    "create_env_manager": (".env_utils", "create_env_manager"),
+    "check_plugin_dependencies": (".depcheck", "check_plugin_dependencies"),
+    "generate_plugin_requirements": (".depcheck", "generate_plugin_requirements"),
+    "extract_dependencies_from_plugin": (".depcheck", "extract_dependencies_from_plugin")
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Import convenience exports on first access."""
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List module attributes, including exports that aren't imported yet."""
+    return sorted(list(globals()) + list(_LAZY))
@@ -4,17 +4,107 @@ AgentKit CLI
 Simple command-line tool for managing agent capabilities and environment.
 """
 
-import argparse
+import functools
+import json
 import sys
+from collections import defaultdict
 from pathlib import Path
-from .loader import load_plugins
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from .loader import load_plugins, plugins_mtime
 from .env_utils import create_env_manager
 
 
+PLUGINS_DIR = "plugins"
+CACHE_FILE = Path.home() / ".cache" / "agentkit" / "plugins.json"
+
+
+class PluginIndex:
+    """Metadata-only view of a plugin registry, restored from the index cache."""
+    
+    def __init__(self, metadata: Dict[str, Dict[str, Any]], tool_names: List[str]):
+        self.metadata = metadata
+        self.tool_names = tool_names
+    
+    def list_tools(self) -> List[str]:
+        """List all available tools."""
+        return list(self.tool_names)
+    
+    def list_plugins(self) -> Dict[str, Dict[str, Any]]:
+        """List all loaded plugins with metadata."""
+        return self.metadata.copy()
+
+
+def _count_plugin_candidates(plugins_dir: Path) -> int:
+    """Count the plugin files and packages the loader will try to load."""
+    count = 0
+    for path in plugins_dir.iterdir():
+        if path.name.startswith("__"):
+            continue
+        if path.is_file() and path.suffix == ".py":
+            count += 1
+        elif path.is_dir() and (path / "__init__.py").exists():
+            count += 1
+    return count
+
+
+def _cache_key(plugins_dir: Path) -> Optional[List[Any]]:
+    """Build the cache key for the plugins directory, or None if it is missing."""
+    if not plugins_dir.exists():
+        return None
+    return [list(sys.path), str(plugins_dir.absolute()), plugins_mtime(plugins_dir)]
+
+
+def _read_index(key: List[Any]) -> Optional[PluginIndex]:
+    """Read the cached plugin index if it matches the given key."""
+    try:
+        cached = json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    
+    if cached.get("key") != key:
+        return None
+    return PluginIndex(cached["metadata"], cached["tools"])
+
+
+def _write_index(key: List[Any], plugins) -> None:
+    """Write the plugin index cache, ignoring any failure."""
+    try:
+        content = json.dumps({
+            "key": key,
+            "metadata": plugins.list_plugins(),
+            "tools": plugins.list_tools()
+        })
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(content)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _get_plugins():
+    """Load plugins and their environment manager once per process.
+    
+    Plugin metadata is also cached on disk, keyed on sys.path and the newest
+    mtime under the plugins directory, so unchanged plugins are not imported
+    again on the next run. Only complete loads are cached, so a plugin that
+    failed (e.g. a missing dependency) is retried next time.
+    """
+    plugins_dir = Path(PLUGINS_DIR)
+    key = _cache_key(plugins_dir)
+    
+    plugins = _read_index(key) if key else None
+    if plugins is None:
+        plugins = load_plugins(PLUGINS_DIR, silent=True)
+        if key and len(plugins.list_plugins()) == _count_plugin_candidates(plugins_dir):
+            _write_index(_cache_key(plugins_dir), plugins)
+    
+    return plugins, create_env_manager(plugins)
+
+
 def cmd_generate(args):
     """Generate .env template file."""
-    plugins = load_plugins(silent=True)
-    env_manager = create_env_manager(plugins)
+    plugins, env_manager = _get_plugins()
     
     output_file = args.output or ".env.template"
     env_manager.generate_env_template(output_file)
@@ -29,11 +119,11 @@ def cmd_generate(args):
 
 def cmd_validate(args):
     """Validate current environment configuration."""
-    plugins = load_plugins(silent=True)
-    env_manager = create_env_manager(plugins)
+    plugins, env_manager = _get_plugins()
     
-    missing = env_manager.validate_env_vars()
-    conflicts = env_manager.check_conflicts()
+    env_vars = env_manager.get_all_env_vars()
+    missing = env_manager.validate_env_vars(env_vars)
+    conflicts = env_manager.check_conflicts(env_vars)
     
     if not missing and not conflicts:
         print("✅ Environment configuration is valid!")
@@ -56,20 +146,26 @@ def cmd_validate(args):
 
 def cmd_summary(args):
     """Show environment variable summary."""
-    plugins = load_plugins(silent=True)
-    env_manager = create_env_manager(plugins)
+    plugins, env_manager = _get_plugins()
     
     print(env_manager.get_plugin_env_summary())
 
 
 def cmd_list(args):
     """List all plugins and their tools."""
-    plugins = load_plugins(silent=True)
+    plugins, _ = _get_plugins()
+    plugin_dict = plugins.list_plugins()
     
-    print(f"📦 Loaded Capabilities ({len(plugins.list_plugins())}):")
+    # Group tool names by plugin
+    tools_by_plugin = defaultdict(list)
+    for tool in plugins.list_tools():
+        plugin_name, _, tool_name = tool.rpartition('.')
+        tools_by_plugin[plugin_name].append(tool_name)
+    
+    print(f"📦 Loaded Capabilities ({len(plugin_dict)}):")
     print()
     
-    for plugin_name, metadata in plugins.list_plugins().items():
+    for plugin_name, metadata in plugin_dict.items():
         name = metadata.get("name", plugin_name)
         version = metadata.get("version", "unknown")
         description = metadata.get("description", "No description")
@@ -78,9 +174,9 @@ def cmd_list(args):
         print(f"   {description}")
         
         # Show tools
-        plugin_tools = [tool for tool in plugins.list_tools() if tool.startswith(f"{plugin_name}.")]
+        plugin_tools = tools_by_plugin.get(plugin_name)
         if plugin_tools:
-            print(f"   Tools: {', '.join([t.split('.', 1)[1] for t in plugin_tools])}")
+            print(f"   Tools: {', '.join(plugin_tools)}")
         
         # Show environment variables
         env_vars = metadata.get("environment_variables", {})
@@ -98,8 +194,7 @@ def cmd_list(args):
 
 def cmd_check(args):
     """Run all checks (validate + conflicts)."""
-    plugins = load_plugins(silent=True)
-    env_manager = create_env_manager(plugins)
+    plugins, env_manager = _get_plugins()
     
     print("🔍 Running environment checks...\n")
     
@@ -113,8 +208,8 @@ def cmd_check(args):
     print()
     
     # Validation
-    missing = env_manager.validate_env_vars()
-    conflicts = env_manager.check_conflicts()
+    missing = env_manager.validate_env_vars(env_vars)
+    conflicts = env_manager.check_conflicts(env_vars)
     
     if missing:
         print("❌ Missing required environment variables:")
@@ -147,7 +242,64 @@ def cmd_check(args):
     return 0
 
 
-def main():
+def cmd_freeze(args):
+    """Freeze discovered plugins into a static index module."""
+    plugins = load_plugins(PLUGINS_DIR, frozen=False)
+    print()
+    
+    # Like the index cache, only freeze complete loads; a plugin missing from
+    # the index would stay missing until someone re-freezes
+    loaded = len(plugins.list_plugins())
+    candidates = _count_plugin_candidates(Path(PLUGINS_DIR))
+    if loaded < candidates:
+        print(f"❌ Only {loaded} of {candidates} capabilities loaded; not freezing")
+        print("💡 Fix the failures above (e.g. install missing dependencies) and re-run")
+        return 1
+    
+    output_file = plugins.freeze()
+    
+    print(f"✅ Froze {len(plugins.list_plugins())} capabilities to {output_file}")
+    print("💡 Re-run after changing plugins; it is ignored once plugins change")
+
+
+COMMANDS = {
+    'generate': cmd_generate,
+    'validate': cmd_validate,
+    'summary': cmd_summary,
+    'list': cmd_list,
+    'check': cmd_check,
+    'freeze': cmd_freeze
+}
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse well-formed command lines without argparse.
+    
+    Returns None for anything else (help, unknown commands, bad options) so
+    the caller can fall back to the full argparse parser and its messages.
+    """
+    if not argv or argv[0] not in COMMANDS:
+        return None
+    
+    command, rest = argv[0], argv[1:]
+    args = SimpleNamespace(command=command, func=COMMANDS[command])
+    
+    if command == 'generate':
+        args.output = None
+        if len(rest) == 2 and rest[0] in ('-o', '--output') and not rest[1].startswith('-'):
+            args.output = rest[1]
+            rest = []
+        elif len(rest) == 1 and rest[0].startswith('--output='):
+            args.output = rest[0].partition('=')[2]
+            rest = []
+    
+    return None if rest else args
+
+
+def _build_parser():
+    """Build the full argparse parser, used for help and error reporting."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Manage agent capabilities and environment",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -159,6 +311,7 @@ Examples:
   python -m agentkit summary               # Show environment summary
   python -m agentkit list                  # List all capabilities
   python -m agentkit check                 # Run all checks
+  python -m agentkit freeze                # Freeze plugins for faster startup
         """
     )
     
@@ -185,11 +338,23 @@ Examples:
     check_parser = subparsers.add_parser('check', help='Run all environment checks')
     check_parser.set_defaults(func=cmd_check)
     
-    args = parser.parse_args()
+    # Freeze command
+    freeze_parser = subparsers.add_parser('freeze', help='Freeze discovered plugins for faster startup')
+    freeze_parser.set_defaults(func=cmd_freeze)
     
-    if not args.command:
-        parser.print_help()
-        return 1
+    return parser
+
+
+def main():
+    # Skip importing and building argparse for the common invocations
+    args = _parse_args_fast(sys.argv[1:])
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
+        
+        if not args.command:
+            parser.print_help()
+            return 1
     
     try:
         return args.func(args) or 0
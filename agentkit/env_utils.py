@@ -82,10 +82,14 @@ class PluginEnvManager:
         
         return template_content
     
-    def validate_env_vars(self) -> List[str]:
-        """Validate that all required environment variables are set."""
+    def validate_env_vars(self, env_vars: Optional[Dict[str, Dict[str, Any]]] = None) -> List[str]:
+        """Validate that all required environment variables are set.
+        
+        Pass env_vars from get_all_env_vars() to avoid collecting them again.
+        """
         missing_vars = []
-        env_vars = self.get_all_env_vars()
+        if env_vars is None:
+            env_vars = self.get_all_env_vars()
         
         for var_name, var_info in env_vars.items():
             if var_info.get('required', False) and not os.getenv(var_name):
@@ -118,10 +122,14 @@ class PluginEnvManager:
         
         return "\n".join(summary_lines)
     
-    def check_conflicts(self) -> List[str]:
-        """Check for potential environment variable naming conflicts."""
+    def check_conflicts(self, env_vars: Optional[Dict[str, Dict[str, Any]]] = None) -> List[str]:
+        """Check for potential environment variable naming conflicts.
+        
+        Pass env_vars from get_all_env_vars() to avoid collecting them again.
+        """
         conflicts = []
-        env_vars = self.get_all_env_vars()
+        if env_vars is None:
+            env_vars = self.get_all_env_vars()
         
         # Look for variables that might conflict (similar names, common patterns)
         var_names = list(env_vars.keys())
@@ -130,9 +138,8 @@ class PluginEnvManager:
         seen_bases = {}
         for var_name in var_names:
             # Extract base name (everything after last underscore)
-            parts = var_name.split('_')
-            if len(parts) > 1:
-                base = parts[-1]
+            _, separator, base = var_name.rpartition('_')
+            if separator:
                 if base in seen_bases:
                     conflicts.append(f"Potential conflict: {var_name} and {seen_bases[base]} both end with '{base}'")
                 else:
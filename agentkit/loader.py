@@ -4,22 +4,88 @@ Simple, lightweight plugin loader.
 Drop this into any project for instant plugin support.
 """
 
+import ast
+import functools
 import importlib
 import importlib.util
+import inspect
+import os
 import platform
 import sys
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Union
+
+
+def _as_async_tool(tool: Callable) -> Callable:
+    """Wrap a synchronous tool so it can be awaited like the other tools.
+    
+    The wrapped function runs in a worker thread so CPU-bound tools don't
+    block the event loop of an agent or MCP server.
+    """
+    if inspect.iscoroutinefunction(tool):
+        return tool
+    
+    @functools.wraps(tool)
+    async def wrapper(*args, **kwargs):
+        # Imported here so metadata-only commands never load asyncio
+        import asyncio
+        return await asyncio.to_thread(tool, *args, **kwargs)
+    
+    return wrapper
+
+
+def plugins_mtime(plugins_dir: Path) -> float:
+    """Get the newest mtime of the plugins directory and everything in it."""
+    paths = [plugins_dir] + [
+        path for path in plugins_dir.rglob("*")
+        if "__pycache__" not in path.parts
+    ]
+    return max(path.stat().st_mtime for path in paths)
+
+
+def _tool_reference(tool: Union[Callable, str]) -> str:
+    """Get the "module:attr" reference for a registered tool."""
+    if isinstance(tool, str):
+        return tool
+    if "<" in tool.__qualname__:
+        raise ValueError(f"Cannot freeze {tool.__qualname__}: tools must be module-level functions")
+    return f"{tool.__module__}:{tool.__qualname__}"
+
+
+def _format_dict(values: Dict[str, Any]) -> str:
+    """Format a dict as Python source with one entry per line.
+    
+    Raises ValueError if the dict can't be written as a Python literal.
+    """
+    if not values:
+        return "{}"
+    entries = [f"    {key!r}: {value!r}," for key, value in values.items()]
+    source = "{\n" + "\n".join(entries) + "\n}"
+    
+    try:
+        literal = ast.literal_eval(source)
+    except (ValueError, SyntaxError) as e:
+        raise ValueError(f"Cannot freeze non-literal plugin data: {e}") from e
+    if literal != values:
+        raise ValueError("Cannot freeze plugin data that doesn't round-trip as a literal")
+    
+    return source
 
 
 class Plugins:
     """Simple plugin registry and loader."""
     
-    def __init__(self, plugins_dir: str = "plugins", silent: bool = False):
+    def __init__(self, plugins_dir: str = "plugins", silent: bool = False, frozen: bool = True):
         self.plugins_dir = Path(plugins_dir)
         self.silent = silent
-        self.tools: Dict[str, Callable] = {}
+        self.frozen = frozen
+        self.tools: Dict[str, Union[Callable, str]] = {}
         self.metadata: Dict[str, Dict[str, Any]] = {}
+        self.init_functions: Dict[str, Union[Callable, str]] = {}
+        # Single-file plugin paths, keyed by module name, and modules loaded from them
+        self.plugin_files: Dict[str, Path] = {}
+        self._file_modules: Dict[str, Any] = {}
         
         # Auto-load plugins on init
         self.load_all()
@@ -52,6 +118,70 @@ class Plugins:
         
         return True
     
+    def _register_tools(self, plugin_name: str, module: Any, module_exports: Dict[str, Any]) -> None:
+        """Register a plugin's exported tools.
+        
+        Tools may be callables or "module:attr" references (relative to the
+        plugin package), which are only imported when the tool is requested.
+        """
+        for tool in module_exports.get("tools", []):
+            if isinstance(tool, str):
+                module_name, _, attr = tool.partition(":")
+                module_name = importlib.util.resolve_name(module_name, module.__package__ or module.__name__)
+                self.tools[f"{plugin_name}.{attr}"] = f"{module_name}:{attr}"
+            elif callable(tool):
+                self.tools[f"{plugin_name}.{tool.__name__}"] = _as_async_tool(tool)
+    
+    def _resolve_tool(self, name: str) -> Optional[Callable]:
+        """Get a tool by name, importing it first if it is a lazy reference."""
+        tool = self.tools.get(name)
+        if isinstance(tool, str):
+            module_name, _, attr = tool.partition(":")
+            try:
+                tool = _as_async_tool(self._import_attr(module_name, attr))
+            except (ImportError, AttributeError) as e:
+                self._log(f"❌ Failed to load tool {name}: {e}")
+                return None
+            self.tools[name] = tool
+        return tool
+    
+    def _import_attr(self, module_name: str, attr: str) -> Any:
+        """Import an attribute from a module that lives in the plugins directory.
+        
+        Single-file plugins are loaded from their file path, as load_plugin
+        does, so a plugin named like another module (e.g. math.py) still
+        resolves to the plugin.
+        """
+        plugin_file = self.plugin_files.get(module_name)
+        if plugin_file is not None:
+            module = self._file_modules.get(module_name)
+            if module is None:
+                spec = importlib.util.spec_from_file_location(module_name, plugin_file)
+                if not spec or not spec.loader:
+                    raise ImportError(f"Cannot load plugin file {plugin_file}")
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                self._file_modules[module_name] = module
+            return getattr(module, attr)
+        
+        plugins_parent = str(self.plugins_dir.absolute())
+        added = plugins_parent not in sys.path
+        if added:
+            sys.path.insert(0, plugins_parent)
+        try:
+            return getattr(importlib.import_module(module_name), attr)
+        finally:
+            if added and plugins_parent in sys.path:
+                sys.path.remove(plugins_parent)
+    
+    def _run_init_function(self, plugin_name: str, init_function: Callable) -> None:
+        """Call a plugin's initialization function, logging any failure."""
+        try:
+            init_function()
+            self._log(f"🔧 Initialized {plugin_name}")
+        except Exception as e:
+            self._log(f"⚠️  Failed to initialize {plugin_name}: {e}")
+    
     def load_plugin(self, plugin_file: Path) -> bool:
         """Load a single plugin file."""
         try:
@@ -83,20 +213,17 @@ class Plugins:
             # Register exports
             plugin_name = plugin_file.stem
             self.metadata[plugin_name] = module_info
+            self.plugin_files[module.__name__] = plugin_file.absolute()
+            self._file_modules[module.__name__] = module
             
             # Register tools
-            for tool in module_exports.get("tools",[]):
-                if callable(tool):
-                    self.tools[f"{plugin_name}.{tool.__name__}"] = tool
+            self._register_tools(plugin_name, module, module_exports)
             
             # Call initialization function if provided
             init_function = module_exports.get("init_function")
             if init_function and callable(init_function):
-                try:
-                    init_function()
-                    self._log(f"🔧 Initialized {plugin_name}")
-                except Exception as e:
-                    self._log(f"⚠️  Failed to initialize {plugin_name}: {e}")
+                self.init_functions[plugin_name] = init_function
+                self._run_init_function(plugin_name, init_function)
             
             name = module_info.get("name", plugin_name)
             version = module_info.get("version", "")
@@ -155,18 +282,13 @@ class Plugins:
             self.metadata[plugin_name] = module_info
             
             # Register tools
-            for tool in module_exports.get("tools", []):
-                if callable(tool):
-                    self.tools[f"{plugin_name}.{tool.__name__}"] = tool
+            self._register_tools(plugin_name, module, module_exports)
             
             # Call initialization function if provided
             init_function = module_exports.get("init_function")
             if init_function and callable(init_function):
-                try:
-                    init_function()
-                    self._log(f"🔧 Initialized {plugin_name}")
-                except Exception as e:
-                    self._log(f"⚠️  Failed to initialize {plugin_name}: {e}")
+                self.init_functions[plugin_name] = init_function
+                self._run_init_function(plugin_name, init_function)
             
             name = module_info.get("name", plugin_name)
             version = module_info.get("version", "")
@@ -177,11 +299,63 @@ class Plugins:
             self._log(f"❌ Failed to load {plugin_dir.name}/: {e}")
             return False
 
+    def _load_frozen(self) -> Optional[int]:
+        """Load plugins from the frozen index if it matches the plugins directory.
+        
+        Returns the number of plugins loaded, or None if there is no usable
+        frozen index (not generated, or the plugins have changed since).
+        """
+        # Any problem with the index (missing, partly written, hand-edited, or
+        # from an older format) falls back to dynamic discovery
+        try:
+            from . import _frozen_plugins
+            
+            if (_frozen_plugins.PLUGINS_DIR != str(self.plugins_dir.absolute())
+                    or _frozen_plugins.MTIME != plugins_mtime(self.plugins_dir)):
+                return None
+            
+            frozen_plugins = dict(_frozen_plugins.PLUGINS)
+            frozen_tools = dict(_frozen_plugins.TOOLS)
+            frozen_init_functions = dict(_frozen_plugins.INIT_FUNCTIONS)
+            frozen_files = {name: Path(path) for name, path in _frozen_plugins.FILES.items()}
+        except Exception:
+            return None
+        
+        self.plugin_files.update(frozen_files)
+        
+        for plugin_name, module_info in frozen_plugins.items():
+            self.metadata[plugin_name] = module_info
+            
+            init_function = frozen_init_functions.get(plugin_name)
+            if init_function:
+                module_name, _, attr = init_function.partition(":")
+                try:
+                    init_function = self._import_attr(module_name, attr)
+                except Exception as e:
+                    self._log(f"⚠️  Failed to initialize {plugin_name}: {e}")
+                else:
+                    self.init_functions[plugin_name] = init_function
+                    self._run_init_function(plugin_name, init_function)
+            
+            name = module_info.get("name", plugin_name)
+            version = module_info.get("version", "")
+            self._log(f"✅ Loaded {name} {version} (frozen)")
+        
+        self.tools.update(frozen_tools)
+        return len(frozen_plugins)
+    
     def load_all(self) -> int:
         """Load all plugins from the plugins directory."""
         if not self.plugins_dir.exists():
             return 0
         
+        if self.frozen:
+            loaded = self._load_frozen()
+            if loaded is not None:
+                if not self.silent and loaded > 0:
+                    self._log(f"Loaded {loaded} plugins")
+                return loaded
+        
         loaded = 0
         
         # Load single-file plugins
@@ -203,7 +377,7 @@ class Plugins:
     
     def get_tool(self, name: str) -> Optional[Callable]:
         """Get a tool by name."""
-        return self.tools.get(name)
+        return self._resolve_tool(name)
     
     def list_tools(self) -> List[str]:
         """List all available tools."""
@@ -211,18 +385,70 @@ class Plugins:
     
     def get_all_tools(self) -> List[Callable]:
         """Get all tools."""
-        return list(self.tools.values())
+        tools = [self._resolve_tool(name) for name in list(self.tools)]
+        return [tool for tool in tools if tool is not None]
 
     
     def list_plugins(self) -> Dict[str, Dict[str, Any]]:
         """List all loaded plugins with metadata."""
         return self.metadata.copy()
+    
+    def freeze(self, output_file: Optional[str] = None) -> str:
+        """Write the loaded plugins to a static index module.
+        
+        The generated module records plugin metadata, "module:attr" tool
+        references and the paths of single-file plugins, so later loads skip
+        discovery and only import tools when they are requested. It is used
+        until the plugins directory changes.
+        """
+        if output_file is None:
+            output_file = str(Path(__file__).with_name("_frozen_plugins.py"))
+        
+        tools = {name: _tool_reference(tool) for name, tool in self.tools.items()}
+        init_functions = {name: _tool_reference(func) for name, func in self.init_functions.items()}
+        files = {name: str(path) for name, path in self.plugin_files.items()}
+        
+        content = "\n".join([
+            "# Generated by `agentkit freeze`; do not edit.",
+            "# Regenerate after changing plugins, or delete to use dynamic discovery.",
+            "",
+            f"PLUGINS_DIR = {str(self.plugins_dir.absolute())!r}",
+            f"MTIME = {plugins_mtime(self.plugins_dir)!r}",
+            "",
+            f"PLUGINS = {_format_dict(self.metadata)}",
+            "",
+            f"TOOLS = {_format_dict(tools)}",
+            "",
+            f"INIT_FUNCTIONS = {_format_dict(init_functions)}",
+            "",
+            f"FILES = {_format_dict(files)}",
+            ""
+        ])
+        
+        # Write to a temporary file and swap it in, so a failed or interrupted
+        # freeze never leaves a partial index behind
+        output_dir = os.path.dirname(os.path.abspath(output_file))
+        fd, temp_file = tempfile.mkstemp(dir=output_dir, prefix=".frozen_plugins_", suffix=".py")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(content)
+            os.replace(temp_file, output_file)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+        
+        return output_file
 
 
 # Convenience functions for simple usage
-def load_plugins(plugins_dir: str = "plugins", silent: bool = False) -> Plugins:
-    """Load plugins and return the registry."""
-    return Plugins(plugins_dir, silent)
+def load_plugins(plugins_dir: str = "plugins", silent: bool = False, frozen: bool = True) -> Plugins:
+    """Load plugins and return the registry.
+    
+    Uses the frozen plugin index written by `agentkit freeze` when it is
+    up to date, unless frozen is False.
+    """
+    return Plugins(plugins_dir, silent, frozen)
 
 
 if __name__ == "__main__":
@@ -21,26 +21,33 @@ _module_info = {
 # END OF MODULE METADATA
 # =============================================================================
 
-# Import functions from our modules
-from .core import analyze_text, summarize_text
-from .utils import clean_text, count_words, extract_keywords
-from .formatters import format_as_markdown, format_as_html, format_as_list
-
 # =============================================================================
 # START OF EXPORTS
 # =============================================================================
+# Tools are referenced as "module:attr" strings so that reading the metadata
+# above never imports the implementation modules (or pydantic).
 _module_exports = {
     "tools": [
-        analyze_text,
-        summarize_text,
-        clean_text,
-        count_words,
-        extract_keywords,
-        format_as_markdown,
-        format_as_html,
-        format_as_list
+        ".core:analyze_text",
+        ".core:summarize_text",
+        ".utils:clean_text",
+        ".utils:count_words",
+        ".utils:extract_keywords",
+        ".formatters:format_as_markdown",
+        ".formatters:format_as_html",
+        ".formatters:format_as_list"
     ]
 }
 # =============================================================================
 # END OF EXPORTS
-# ============================================================================= 
\ No newline at end of file
+# =============================================================================
+
+
+def __getattr__(name):
+    """Import exported tools on first attribute access."""
+    for tool in _module_exports["tools"]:
+        module_name, _, attr = tool.partition(":")
+        if attr == name:
+            import importlib
+            return getattr(importlib.import_module(module_name, __name__), attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,39 +2,48 @@
 Core text processing functions.
 """
 
+import functools
 import os
 import re
 from typing import Annotated, Dict, Any
 from pydantic import Field
 
-from .utils import clean_text, count_words
+from .utils import _WORD_RE
 
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+# Matches only the last mark of each run, which lets the regex engine scan
+# for a single character class instead of repeating it
+_SENTENCE_MARK_RE = re.compile(r'[.!?](?![.!?])')
 
-async def analyze_text(
+
+@functools.lru_cache(maxsize=1)
+def _max_length() -> int:
+    """Get the maximum text length, read from the environment on first use."""
+    return int(os.getenv("TEXT_PROCESSOR_MAX_LENGTH", "10000"))
+
+
+def analyze_text(
     text: Annotated[str, Field(description="The text to analyze")]
 ) -> Dict[str, Any]:
     """Analyze text and return comprehensive statistics."""
-    max_length = int(os.getenv("TEXT_PROCESSOR_MAX_LENGTH", "10000"))
+    max_length = _max_length()
     
     if len(text) > max_length:
         raise ValueError(f"Text too long. Maximum length is {max_length} characters.")
     
-    # Clean the text first
-    cleaned = await clean_text(text)
-    
-    # Basic statistics
+    # Basic statistics, reusing one tokenization for the word-based counts
+    words = _WORD_RE.findall(text)
     char_count = len(text)
-    char_count_no_spaces = len(text.replace(" ", ""))
-    word_count = await count_words(text)
-    line_count = len(text.split('\n'))
-    paragraph_count = len([p for p in text.split('\n\n') if p.strip()])
+    char_count_no_spaces = char_count - text.count(" ")
+    word_count = len(words)
+    line_count = text.count('\n') + 1
+    paragraph_count = sum(1 for p in text.split('\n\n') if p and not p.isspace())
     
     # Sentence count (basic)
-    sentence_count = len(re.findall(r'[.!?]+', text))
+    sentence_count = len(_SENTENCE_MARK_RE.findall(text))
     
     # Average word length
-    words = text.split()
-    avg_word_length = sum(len(word.strip('.,!?;:')) for word in words) / len(words) if words else 0
+    avg_word_length = sum(map(len, words)) / word_count if words else 0
     
     return {
         "character_count": char_count,
@@ -48,18 +57,18 @@ async def analyze_text(
     }
 
 
-async def summarize_text(
+def summarize_text(
     text: Annotated[str, Field(description="The text to summarize")],
     max_sentences: Annotated[int, Field(description="Maximum number of sentences in summary", ge=1, le=10)] = 3
 ) -> str:
     """Create a simple extractive summary of the text."""
-    max_length = int(os.getenv("TEXT_PROCESSOR_MAX_LENGTH", "10000"))
+    max_length = _max_length()
     
     if len(text) > max_length:
         raise ValueError(f"Text too long. Maximum length is {max_length} characters.")
     
     # Split into sentences
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _SENTENCE_END_RE.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
     
     if len(sentences) <= max_sentences:
@@ -72,18 +81,13 @@ async def summarize_text(
         # Prefer sentences in the beginning and middle
         position_score = 1.0 if i < len(sentences) * 0.3 else 0.5
         score = word_count * position_score
-        scored_sentences.append((score, sentence))
+        scored_sentences.append((score, i))
     
-    # Sort by score and take top sentences
-    scored_sentences.sort(reverse=True)
-    top_sentences = [sentence for _, sentence in scored_sentences[:max_sentences]]
+    # Sort by score (earlier sentences win ties) and take top sentences
+    scored_sentences.sort(key=lambda item: (-item[0], item[1]))
+    top_indices = {i for _, i in scored_sentences[:max_sentences]}
     
     # Maintain original order
-    summary_sentences = []
-    for sentence in sentences:
-        if sentence in top_sentences:
-            summary_sentences.append(sentence)
-            if len(summary_sentences) >= max_sentences:
-                break
+    summary_sentences = [sentences[i] for i in sorted(top_indices)]
     
     return '. '.join(summary_sentences) + '.' 
\ No newline at end of file
@@ -2,57 +2,14 @@
 Text formatting functions.
 """
 
+import io
 import re
-from typing import Annotated
+from typing import Annotated, TextIO
 from pydantic import Field
 
+_NEWLINES_RE = re.compile(r'\n+')
 
-async def format_as_markdown(
-    text: Annotated[str, Field(description="The text to format as markdown")],
-    title: Annotated[str, Field(description="Title for the markdown document")] = "Document"
-) -> str:
-    """Format text as a markdown document with basic structure."""
-    lines = text.split('\n')
-    formatted_lines = [f"# {title}", ""]
-    
-    current_paragraph = []
-    
-    for line in lines:
-        line = line.strip()
-        
-        if not line:  # Empty line
-            if current_paragraph:
-                formatted_lines.append(' '.join(current_paragraph))
-                formatted_lines.append("")
-                current_paragraph = []
-        else:
-            current_paragraph.append(line)
-    
-    # Add final paragraph if exists
-    if current_paragraph:
-        formatted_lines.append(' '.join(current_paragraph))
-    
-    return '\n'.join(formatted_lines)
-
-
-async def format_as_html(
-    text: Annotated[str, Field(description="The text to format as HTML")],
-    title: Annotated[str, Field(description="Title for the HTML document")] = "Document"
-) -> str:
-    """Format text as a simple HTML document."""
-    # Escape HTML characters
-    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-    
-    # Split into paragraphs
-    paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-    
-    html_paragraphs = []
-    for paragraph in paragraphs:
-        # Replace line breaks within paragraphs with spaces
-        paragraph = re.sub(r'\n+', ' ', paragraph)
-        html_paragraphs.append(f"    <p>{paragraph}</p>")
-    
-    html_content = f"""<!DOCTYPE html>
+_HTML_HEAD_FMT = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -78,23 +35,86 @@ async def format_as_html(
 </head>
 <body>
     <h1>{title}</h1>
-{chr(10).join(html_paragraphs)}
+"""
+_HTML_FOOT = """
 </body>
 </html>"""
+
+
+def write_markdown(text: str, out: TextIO, title: str = "Document") -> None:
+    """Write text as a markdown document to a file-like object."""
+    out.write(f"# {title}\n")
     
-    return html_content
+    current_paragraph = []
+    
+    for line in text.split('\n'):
+        line = line.strip()
+        
+        if not line:  # Empty line
+            if current_paragraph:
+                out.write(f"\n{' '.join(current_paragraph)}\n")
+                current_paragraph.clear()
+        else:
+            current_paragraph.append(line)
+    
+    # Add final paragraph if exists
+    if current_paragraph:
+        out.write(f"\n{' '.join(current_paragraph)}")
+
 
+def format_as_markdown(
+    text: Annotated[str, Field(description="The text to format as markdown")],
+    title: Annotated[str, Field(description="Title for the markdown document")] = "Document"
+) -> str:
+    """Format text as a markdown document with basic structure."""
+    buf = io.StringIO()
+    write_markdown(text, buf, title)
+    return buf.getvalue()
 
-async def format_as_list(
+
+def write_html(text: str, out: TextIO, title: str = "Document") -> None:
+    """Write text as a simple HTML document to a file-like object."""
+    out.write(_HTML_HEAD_FMT.format(title=title))
+    
+    separator = ""
+    for paragraph in text.split('\n\n'):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        
+        # Escape HTML characters one paragraph at a time, so no escaped copy
+        # of the whole input is built
+        paragraph = paragraph.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        
+        # Replace line breaks within paragraphs with spaces
+        out.write(f"{separator}    <p>")
+        out.write(_NEWLINES_RE.sub(' ', paragraph))
+        out.write("</p>")
+        separator = "\n"
+    
+    out.write(_HTML_FOOT)
+
+
+def format_as_html(
+    text: Annotated[str, Field(description="The text to format as HTML")],
+    title: Annotated[str, Field(description="Title for the HTML document")] = "Document"
+) -> str:
+    """Format text as a simple HTML document."""
+    buf = io.StringIO()
+    write_html(text, buf, title)
+    return buf.getvalue()
+
+
+def format_as_list(
     text: Annotated[str, Field(description="The text to format as a list")],
     list_type: Annotated[str, Field(description="Type of list: 'bullet' or 'numbered'")] = "bullet"
 ) -> str:
     """Format text as a bulleted or numbered list."""
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [s for s in (ln.strip() for ln in text.split('\n')) if s]
     
     if list_type == "numbered":
-        formatted_lines = [f"{i+1}. {line}" for i, line in enumerate(lines)]
+        formatted_lines = (f"{i}. {line}" for i, line in enumerate(lines, 1))
     else:  # bullet
-        formatted_lines = [f"• {line}" for line in lines]
+        formatted_lines = ("• " + line for line in lines)
     
-    return '\n'.join(formatted_lines) 
\ No newline at end of file
+    return '\n'.join(formatted_lines)
@@ -3,83 +3,97 @@ Utility functions for text processing.
 """
 
 import re
+from collections import Counter
 from typing import Annotated
 from pydantic import Field
 
+_WS_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\b\w+\b')
 
-async def clean_text(
+# Common stop words (basic list)
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we',
+    'they', 'me', 'him', 'her', 'us', 'them', 'my', 'your', 'his', 'its',
+    'our', 'their'
+})
+
+# Words of three or more characters that aren't stop words. Shorter stop
+# words can't match \w{3,} anyway, so they're left out of the alternation.
+_KEYWORD_RE = re.compile(
+    r'\b(?!(?:'
+    + '|'.join(re.escape(word) for word in sorted(_STOP_WORDS, key=len, reverse=True) if len(word) > 2)
+    + r')\b)\w{3,}\b'
+)
+
+# Markdown syntax patterns
+_MD_HEADER_RE = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_MD_BOLD_STAR_RE = re.compile(r'\*\*([^*]+)\*\*')
+_MD_ITALIC_STAR_RE = re.compile(r'\*([^*]+)\*')
+_MD_BOLD_UNDERSCORE_RE = re.compile(r'__([^_]+)__')
+_MD_ITALIC_UNDERSCORE_RE = re.compile(r'_([^_]+)_')
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_MD_CODE_BLOCK_RE = re.compile(r'```[^`]*```', re.DOTALL)
+_MD_CODE_INLINE_RE = re.compile(r'`([^`]+)`')
+
+
+def clean_text(
     text: Annotated[str, Field(description="The text to clean")]
 ) -> str:
     """Clean text by removing extra whitespace and normalizing."""
     # Remove extra whitespace
-    cleaned = re.sub(r'\s+', ' ', text)
+    cleaned = _WS_RE.sub(' ', text)
     
     # Remove leading/trailing whitespace
     cleaned = cleaned.strip()
     
-    # Normalize quotes
-    cleaned = cleaned.replace('"', '"').replace('"', '"')
-    cleaned = cleaned.replace(''', "'").replace(''', "'")
+    # Normalize smart quotes
+    cleaned = cleaned.replace('\u201c', '"').replace('\u201d', '"')
+    cleaned = cleaned.replace('\u2018', "'").replace('\u2019', "'")
     
     return cleaned
 
 
-async def count_words(
+def count_words(
     text: Annotated[str, Field(description="The text to count words in")]
 ) -> int:
     """Count words in text, handling punctuation properly."""
     # Remove punctuation and split
-    words = re.findall(r'\b\w+\b', text.lower())
+    words = _WORD_RE.findall(text.lower())
     return len(words)
 
 
 def _remove_markdown_syntax(text: str) -> str:
     """Helper function to remove markdown syntax."""
     # Remove headers
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+    text = _MD_HEADER_RE.sub('', text)
     
     # Remove bold/italic
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)
-    text = re.sub(r'__([^_]+)__', r'\1', text)
-    text = re.sub(r'_([^_]+)_', r'\1', text)
+    text = _MD_BOLD_STAR_RE.sub(r'\1', text)
+    text = _MD_ITALIC_STAR_RE.sub(r'\1', text)
+    text = _MD_BOLD_UNDERSCORE_RE.sub(r'\1', text)
+    text = _MD_ITALIC_UNDERSCORE_RE.sub(r'\1', text)
     
     # Remove links
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+    text = _MD_LINK_RE.sub(r'\1', text)
     
     # Remove code blocks
-    text = re.sub(r'```[^`]*```', '', text, flags=re.DOTALL)
-    text = re.sub(r'`([^`]+)`', r'\1', text)
+    text = _MD_CODE_BLOCK_RE.sub('', text)
+    text = _MD_CODE_INLINE_RE.sub(r'\1', text)
     
     return text
 
 
-async def extract_keywords(
+def extract_keywords(
     text: Annotated[str, Field(description="The text to extract keywords from")],
     max_keywords: Annotated[int, Field(description="Maximum number of keywords to return", ge=1, le=20)] = 10
 ) -> list[str]:
     """Extract simple keywords from text based on word frequency."""
-    # Clean and normalize
-    cleaned = await clean_text(text)
-    
-    # Remove common stop words (basic list)
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-        'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
-        'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-        'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we',
-        'they', 'me', 'him', 'her', 'us', 'them', 'my', 'your', 'his', 'its',
-        'our', 'their'
-    }
-    
-    # Extract words and count frequency
-    words = re.findall(r'\b\w+\b', cleaned.lower())
-    word_freq = {}
-    
-    for word in words:
-        if len(word) > 2 and word not in stop_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
+    # Extract keyword candidates and count frequency; tokenizing on word
+    # boundaries already ignores the whitespace and quotes clean_text handles
+    keywords = _KEYWORD_RE.findall(text.lower())
     
-    # Sort by frequency and return top keywords
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    return [word for word, freq in sorted_words[:max_keywords]] 
\ No newline at end of file
+    # Return the most frequent keywords
+    return [word for word, _ in Counter(keywords).most_common(max_keywords)]